@@ -1,6 +1,21 @@
-from urllib.parse import urlparse, parse_qs
-from typing import List, Dict, Set
+from typing import List, Dict, FrozenSet, Iterator
 import os
+import re
+from urllib.parse import urlparse
+
+# Path keywords per vector, matched in a single scan. The lookahead keeps
+# overlapping keywords (e.g. 'graphqlogin') matching like plain substring checks.
+_PATH_VECTOR_RE = re.compile(
+    r'(?=(?P<ADMIN>admin|dashboard)|(?P<API>api|rest|graphql)|(?P<AUTH>login|auth|signin))'
+)
+_PATH_VECTORS = ('ADMIN', 'API', 'AUTH')
+
+# Default parameter patterns for classification
+_DEFAULT_IDOR = frozenset({'id', 'user_id', 'account_id', 'uuid', 'guid', 'userid'})
+_DEFAULT_LFI = frozenset({'file', 'path', 'lang', 'page', 'include', 'dir', 'folder', 'template'})
+_DEFAULT_REDIRECT = frozenset({'url', 'redirect', 'next', 'redir', 'return', 'to', 'goto', 'link'})
+_DEFAULT_XSS = frozenset({'q', 'query', 'search', 'keyword', 'name', 'message', 'input', 'content'})
+_DEFAULT_SQLI = frozenset({'category', 'sort', 'order', 'filter', 'where', 'select'})
 
 class Analyzer:
     """Analyzes discovered URLs for potential vulnerabilities."""
@@ -9,12 +24,12 @@ class Analyzer:
         self.formatter = formatter
         self.wordlist_config = wordlist_config or {}
         
-        # Define default parameter patterns for classification
-        self.default_idor_patterns = {'id', 'user_id', 'account_id', 'uuid', 'guid', 'userid'}
-        self.default_lfi_patterns = {'file', 'path', 'lang', 'page', 'include', 'dir', 'folder', 'template'}
-        self.default_redirect_patterns = {'url', 'redirect', 'next', 'redir', 'return', 'to', 'goto', 'link'}
-        self.default_xss_patterns = {'q', 'query', 'search', 'keyword', 'name', 'message', 'input', 'content'}
-        self.default_sqli_patterns = {'category', 'sort', 'order', 'filter', 'where', 'select'}
+        # Default parameter patterns for classification
+        self.default_idor_patterns = _DEFAULT_IDOR
+        self.default_lfi_patterns = _DEFAULT_LFI
+        self.default_redirect_patterns = _DEFAULT_REDIRECT
+        self.default_xss_patterns = _DEFAULT_XSS
+        self.default_sqli_patterns = _DEFAULT_SQLI
         
         # Load and merge custom wordlists with defaults
         self.idor_patterns = self._load_patterns('idor', self.default_idor_patterns)
@@ -23,19 +38,28 @@ class Analyzer:
         self.xss_patterns = self._load_patterns('xss', self.default_xss_patterns)
         self.sqli_patterns = self._load_patterns('sqli', self.default_sqli_patterns)
         
-    def _load_patterns(self, category: str, default_patterns: Set[str]) -> Set[str]:
-        """Load patterns from wordlist file and merge with defaults."""
-        patterns = default_patterns.copy()
+        # Parameter vectors in reporting order, checked in one pass per URL
+        self._param_vectors = (
+            ('IDOR', self.idor_patterns),
+            ('LFI', self.lfi_patterns),
+            ('REDIR', self.redirect_patterns),
+            ('XSS', self.xss_patterns),
+            ('SQLI', self.sqli_patterns),
+        )
         
+    def _load_patterns(self, category: str, default_patterns: FrozenSet[str]) -> FrozenSet[str]:
+        """Load patterns from wordlist file and merge with defaults."""
         if category not in self.wordlist_config:
-            return patterns
+            return default_patterns
             
         wordlist_path = self.wordlist_config[category]
         
         if not os.path.isfile(wordlist_path):
             self.formatter.print_warning(f"Custom {category.upper()} wordlist not found: {wordlist_path}")
-            return patterns
+            return default_patterns
             
+        patterns = set(default_patterns)
+        
         try:
             with open(wordlist_path, 'r', encoding='utf-8') as f:
                 custom_patterns = set()
@@ -53,10 +77,14 @@ class Analyzer:
         except Exception as e:
             self.formatter.print_error(f"Failed to load {category.upper()} wordlist: {str(e)}")
             
-        return patterns
+        return frozenset(patterns)
         
     def analyze_urls(self, discovered_urls: List[Dict]) -> List[Dict]:
         """Analyze all discovered URLs for potential vulnerabilities."""
+        return list(self.iter_analyze(discovered_urls))
+    
+    def iter_analyze(self, discovered_urls: List[Dict]) -> Iterator[Dict]:
+        """Analyze discovered URLs one at a time, yielding each as soon as its vectors are known."""
         self.formatter.print_status(f"Analyzing {len(discovered_urls)} discovered URLs...")
         
         # Print pattern statistics
@@ -73,55 +101,34 @@ class Analyzer:
         else:
             self.formatter.print_info(f"Using {total_current} default patterns")
         
-        results = []
+        analyze_one = self.analyze_one
         
         for url_info in discovered_urls:
-            url = url_info['url']
-            params = url_info['params']
+            yield analyze_one(url_info)
             
-            # Skip JavaScript files for parameter analysis
-            if url_info.get('js_file'):
-                url_info['vectors'] = ['JS']
-                results.append(url_info)
-                continue
-                
-            # Identify potential vectors
-            vectors = self._identify_vectors(url, params, url_info)
-            
-            # Add vectors to URL info
-            url_info['vectors'] = vectors
-            results.append(url_info)
+    def analyze_one(self, url_info: Dict) -> Dict:
+        """Tag a single discovered URL with its potential vectors and return it."""
+        # Skip JavaScript files for parameter analysis
+        if url_info.get('js_file'):
+            url_info['vectors'] = ['JS']
+        else:
+            url_info['vectors'] = self._identify_vectors(url_info)
             
-        return results
+        return url_info
     
-    def _identify_vectors(self, url: str, params: Dict, url_info: Dict) -> List[str]:
+    def _identify_vectors(self, url_info: Dict) -> List[str]:
         """Identify potential vulnerability vectors based on URL and parameters."""
-        vectors = []
+        # Parameter names are usually lowercased by the crawler already
+        param_names = url_info.get('param_names_lower')
+        if param_names is None:
+            param_names = frozenset(k.lower() for k in url_info['params'])
         
-        # Check for parameter-based vulnerabilities
-        if params:
-            # Convert parameters to lowercase for matching
-            param_names = {k.lower() for k in params.keys()}
-            
-            # Check for IDOR patterns
-            if any(pattern in param_names for pattern in self.idor_patterns):
-                vectors.append('IDOR')
-                
-            # Check for LFI patterns
-            if any(pattern in param_names for pattern in self.lfi_patterns):
-                vectors.append('LFI')
-                
-            # Check for Open Redirect patterns
-            if any(pattern in param_names for pattern in self.redirect_patterns):
-                vectors.append('REDIR')
-                
-            # Check for XSS patterns
-            if any(pattern in param_names for pattern in self.xss_patterns):
-                vectors.append('XSS')
-                
-            # Check for SQLi patterns
-            if any(pattern in param_names for pattern in self.sqli_patterns):
-                vectors.append('SQLI')
+        # Check for parameter-based vulnerabilities (IDOR, LFI, REDIR, XSS, SQLI)
+        if param_names:
+            vectors = [vector for vector, patterns in self._param_vectors
+                       if not patterns.isdisjoint(param_names)]
+        else:
+            vectors = []
         
         # Check for form-based vulnerabilities
         if url_info.get('has_form'):
@@ -132,7 +139,7 @@ class Analyzer:
             vectors.append('UPLOAD')
             
         # If no specific vectors found but has parameters, mark as potential XSS
-        if params and not vectors:
+        if param_names and not vectors:
             vectors.append('XSS')
             
         # If still no vectors but has a form, mark as potential CSRF
@@ -140,16 +147,13 @@ class Analyzer:
             vectors.append('CSRF')
             
         # Add additional classifications based on URL path
-        path = urlparse(url).path.lower()
+        path_lower = url_info.get('path_lower')
+        if path_lower is None:
+            path_lower = urlparse(url_info['url']).path.lower()
+        found = {m.lastgroup for m in _PATH_VECTOR_RE.finditer(path_lower)}
         
-        if 'admin' in path or 'dashboard' in path:
-            vectors.append('ADMIN')
-            
-        if 'api' in path or 'rest' in path or 'graphql' in path:
-            vectors.append('API')
-            
-        if 'login' in path or 'auth' in path or 'signin' in path:
-            vectors.append('AUTH')
+        if found:
+            vectors.extend(v for v in _PATH_VECTORS if v in found)
             
         # If no vectors identified, mark as INFO
         if not vectors:
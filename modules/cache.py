@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional, Tuple
+
+_MAX_AGE_RE = re.compile(r'max-age\s*=\s*(\d+)')
+
+# Status codes that are safe to cache without explicit freshness headers;
+# server errors and 429 are transient and must not be replayed on re-scans
+_CACHEABLE_STATUSES = frozenset({200, 203, 204, 300, 301, 308, 404, 410})
+
+# (status_code, content_type, text); text is None when the body was not kept
+CachedResponse = Tuple[int, str, Optional[str]]
+
+
+class DiskCache:
+    """On-disk HTTP response cache for repeated scans of the same target."""
+    
+    def __init__(self, cache_dir: str, default_ttl: int = 3600):
+        self.cache_dir = cache_dir
+        self.default_ttl = default_ttl
+        os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, url: str) -> str:
+        """Return the cache file path for a URL."""
+        digest = hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+    
+    def _expiry(self, headers: Mapping[str, str]) -> Optional[float]:
+        """Work out when a response goes stale, or None if it must not be stored."""
+        cache_control = headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control or 'no-cache' in cache_control:
+            return None
+        
+        match = _MAX_AGE_RE.search(cache_control)
+        if match:
+            return time.time() + int(match.group(1))
+        
+        expires = headers.get('Expires')
+        if expires:
+            try:
+                expires_at = parsedate_to_datetime(expires)
+            except (TypeError, ValueError):
+                return None
+            # '-0000' dates come back naive but are still UTC
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            return expires_at.timestamp()
+        
+        return time.time() + self.default_ttl
+    
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL if there is a fresh one."""
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # A malformed entry is treated as a miss rather than failing the scan
+        if not isinstance(entry, dict):
+            return None
+        try:
+            if entry.get('url') != url or entry.get('expires', 0) <= time.time():
+                return None
+            return entry['status_code'], entry['content_type'], entry['text']
+        except (KeyError, TypeError):
+            return None
+    
+    def put(self, url: str, status_code: int, content_type: str,
+            text: Optional[str], headers: Mapping[str, str]) -> None:
+        """Store a response unless its status or headers say it may not be cached."""
+        if status_code not in _CACHEABLE_STATUSES:
+            return
+        
+        expires = self._expiry(headers)
+        if expires is None or expires <= time.time():
+            return
+        
+        entry = {
+            'url': url,
+            'status_code': status_code,
+            'content_type': content_type,
+            'text': text,
+            'expires': expires
+        }
+        
+        # Write to a temporary file first so concurrent readers never see partial entries
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            # A failed write only costs a cache miss next time
+            if tmp_path is not None:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
@@ -1,21 +1,84 @@
 import time
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse, parse_qs
-from bs4 import BeautifulSoup
-from typing import List, Dict, Set
+from bs4 import BeautifulSoup, SoupStrainer
+from typing import List, Dict, Set, Optional, Tuple, Mapping
+
+# Only the tags the crawler inspects are built into the parse tree
+_STRAINER = SoupStrainer(['a', 'form', 'input', 'script'])
+
+# Upper bound on how much of a single page is downloaded and parsed
+MAX_PAGE_BYTES = 2 * 1024 * 1024
+
+# Links that never lead to a crawlable page
+_SKIP_PREFIXES = ('javascript:', '#', 'mailto:', 'tel:')
+
+# Result of a single page walk: (anchor hrefs, has_form, has_upload, script srcs)
+PageSummary = Tuple[List[str], bool, bool, List[str]]
+
+# Stand-in summary for HTML pages too large to parse
+_UNPARSED_PAGE: PageSummary = ([], False, False, [])
+
+
+@lru_cache(maxsize=4096)
+def _netloc(url: str) -> str:
+    """Return the netloc of a URL, memoized for links repeated across pages."""
+    return urlparse(url).netloc
+
+
+class _Throttle:
+    """Spaces out request starts so concurrent workers stay polite to the server."""
+    
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+        
+    def wait(self) -> None:
+        """Block until the next request slot is available."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
 
 class Crawler:
     """WebDust crawler to discover URLs, forms, and upload fields."""
     
-    def __init__(self, formatter, verbose=False):
+    def __init__(self, formatter, verbose=False, max_workers=10, delay=0.1, fetch_js=False, cache=None):
         self.formatter = formatter
         self.verbose = verbose
+        self.max_workers = max_workers
+        self.fetch_js = fetch_js
+        self.cache = cache
+        self._throttle = _Throttle(delay)
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'WebDust/1.1 (+https://github.com/Cr3zy-dev/webdust)'
         })
+        
+        # Crawls stay on one host, so keep one pool with a connection per worker.
+        # Retry-After is ignored so a server cannot stall workers with long waits.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=max_workers,
+            max_retries=Retry(total=1, backoff_factor=0.1,
+                              status_forcelist=(502, 503, 504), raise_on_status=False,
+                              respect_retry_after_header=False)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         self.visited: Set[str] = set()
+        self._base_netloc = ''
         self.discovered_urls: List[Dict] = []
+        self._pending_js: List[Dict] = []
         self.total_urls = 0
         self.current_url = 0
         
@@ -29,137 +92,245 @@ class Crawler:
         self.formatter.print_status(f"Starting crawl from {base_url} with depth {max_depth}")
         
         # Start with the base URL at depth 0
-        urls_to_visit = [(base_url, 0)]
+        base_url = self.normalize_url(base_url)
+        self._base_netloc = urlparse(base_url).netloc
+        level = [base_url]
+        enqueued: Set[str] = {base_url}
         
-        while urls_to_visit:
-            url, depth = urls_to_visit.pop(0)
-            
-            # Normalize URL
-            url = self.normalize_url(url)
-            
-            # Skip if already visited
-            if url in self.visited:
-                continue
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            try:
+                # Crawl one depth level at a time so every URL is expanded at its shallowest depth
+                for depth in range(max_depth + 1):
+                    if not level:
+                        break
+                        
+                    futures = []
+                    for url in level:
+                        # Skip if already visited
+                        if url in self.visited:
+                            continue
+                            
+                        # Mark as visited
+                        self.visited.add(url)
+                        
+                        futures.append((url, executor.submit(self._fetch, url)))
+                        
+                    next_level = []
+                    
+                    # Handle results in submission order so the output does not depend on timing
+                    for url, future in futures:
+                        # Count the request once it has finished, not when it was queued
+                        wait((future,))
+                        self.current_url += 1
+                        self.formatter.print_progress(f"Crawling ({self.current_url}/{self.total_urls or '?'}): {url}")
+                        
+                        try:
+                            status_code, content_type, page = future.result()
+                        except requests.RequestException as e:
+                            if self.verbose:
+                                self.formatter.print_warning(f"Error fetching {url}: {str(e)}")
+                            continue
+                            
+                        # Skip non-HTML responses
+                        if page is None:
+                            if 'javascript' in content_type.lower():
+                                self.discovered_urls.append({
+                                    'url': url,
+                                    'params': {},
+                                    'has_form': False,
+                                    'has_upload': False,
+                                    'js_file': True,
+                                    'status_code': status_code
+                                })
+                                continue
+                            if 'text/html' not in content_type.lower():
+                                continue
+                                
+                            # Oversized pages are still listed, just without links or forms
+                            if self.verbose:
+                                self.formatter.print_warning(f"Not parsing {url}: page larger than {MAX_PAGE_BYTES} bytes")
+                            page = _UNPARSED_PAGE
+                            
+                        # Extract page details
+                        url_info = self._extract_page_info(url, page, status_code)
+                        self.discovered_urls.append(url_info)
+                        
+                        # Stop if we've reached max depth
+                        if depth >= max_depth:
+                            continue
+                            
+                        # Find all links on the page
+                        new_urls = self._extract_links(url, page[0])
+                        
+                        # Update total URL count estimation
+                        self.total_urls = max(self.total_urls, self.current_url + len(new_urls))
+                        
+                        # Add new URLs to the next level, once each
+                        for new_url in new_urls:
+                            new_url = self.normalize_url(new_url)
+                            if new_url not in self.visited and new_url not in enqueued:
+                                enqueued.add(new_url)
+                                next_level.append(new_url)
+                                
+                    level = next_level
+                    
+                # Resolve status codes of script files found along the way
+                if self._pending_js:
+                    self.formatter.print_progress(f"Fetching {len(self._pending_js)} JavaScript files...")
+                    for js_info, status_code in zip(self._pending_js, executor.map(self._fetch_status, self._pending_js)):
+                        js_info['status_code'] = status_code
+                    self._pending_js = []
+            except BaseException:
+                # Drop queued fetches so Ctrl-C does not wait for the rest of the level
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
                 
-            # Mark as visited
-            self.visited.add(url)
-            
-            # Increment progress counter
-            self.current_url += 1
+        self.formatter._clear_progress()
+        self.formatter.print_success(f"Crawl complete. Discovered {len(self.discovered_urls)} unique endpoints.")
+        return self.discovered_urls
+    
+    def _fetch(self, url: str) -> Tuple[int, str, Optional[PageSummary]]:
+        """Fetch a page in a worker thread and summarize it if it is HTML."""
+        status_code, content_type, text = self._get(url)
+        if text is None:
+            return status_code, content_type, None
             
-            # Display progress
-            self.formatter.print_progress(f"Crawling ({self.current_url}/{self.total_urls or '?'}): {url}")
+        return status_code, content_type, self._walk_page(BeautifulSoup(text, 'lxml', parse_only=_STRAINER))
+    
+    def _get(self, url: str) -> Tuple[int, str, Optional[str]]:
+        """Return a URL's status, content type and HTML text, from the cache when possible."""
+        cached = self.cache.get(url) if self.cache is not None else None
+        if cached is not None:
+            return cached
             
-            try:
-                # Fetch the page
-                response = self.session.get(url, timeout=10)
-                
-                # Skip non-HTML responses
-                content_type = response.headers.get('Content-Type', '')
-                if 'text/html' not in content_type.lower():
-                    if 'javascript' in content_type.lower():
-                        self.discovered_urls.append({
-                            'url': url,
-                            'params': {},
-                            'has_form': False,
-                            'has_upload': False,
-                            'js_file': True,
-                            'status_code': response.status_code
-                        })
-                    continue
-                
-                # Parse HTML
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract page details
-                url_info = self._extract_page_info(url, soup, response)
-                self.discovered_urls.append(url_info)
-                
-                # Stop if we've reached max depth
-                if depth >= max_depth:
-                    continue
-                
-                # Find all links on the page
-                new_urls = self._extract_links(base_url, url, soup)
+        status_code, content_type, text, headers = self._download(url)
+        if self.cache is not None:
+            self.cache.put(url, status_code, content_type, text, headers)
+        return status_code, content_type, text
+    
+    def _download(self, url: str) -> Tuple[int, str, Optional[str], Mapping[str, str]]:
+        """Request a URL and return its status, content type, HTML text (if any) and headers."""
+        self._throttle.wait()
+        
+        # Stream the body so non-HTML and oversized responses are never downloaded
+        with self.session.get(url, timeout=10, stream=True) as response:
+            status_code = response.status_code
+            headers = response.headers
+            content_type = headers.get('Content-Type', '')
+            if 'text/html' not in content_type.lower():
+                return status_code, content_type, None, headers
                 
-                # Update total URL count estimation
-                self.total_urls = max(self.total_urls, self.current_url + len(new_urls))
+            try:
+                content_length = int(headers.get('Content-Length') or 0)
+            except ValueError:
+                content_length = 0
+            if content_length > MAX_PAGE_BYTES:
+                return status_code, content_type, None, headers
                 
-                # Add new URLs to the queue
-                for new_url in new_urls:
-                    if new_url not in self.visited:
-                        urls_to_visit.append((new_url, depth + 1))
-                        
-            except requests.RequestException as e:
-                if self.verbose:
-                    self.formatter.print_warning(f"Error fetching {url}: {str(e)}")
-                continue
+            # Read at most MAX_PAGE_BYTES, in case the length header is missing or wrong
+            chunks = []
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_PAGE_BYTES:
+                    break
+                    
+        body = b''.join(chunks)[:MAX_PAGE_BYTES]
+        try:
+            text = body.decode(response.encoding or 'utf-8', 'replace')
+        except LookupError:
+            text = body.decode('utf-8', 'replace')
             
-            # Small delay to be nice to the server
-            time.sleep(0.1)
-            
-        self.formatter._clear_progress()
-        self.formatter.print_success(f"Crawl complete. Discovered {len(self.discovered_urls)} unique endpoints.")
-        return self.discovered_urls
+        return status_code, content_type, text, headers
     
-    def _extract_links(self, base_url: str, current_url: str, soup: BeautifulSoup) -> List[str]:
-        """Extract all links from the page."""
+    def _walk_page(self, soup: BeautifulSoup) -> PageSummary:
+        """Collect links, forms, upload fields and scripts in a single pass over the page."""
+        anchors = []
+        script_srcs = []
+        has_form = False
+        has_upload = False
+        
+        for tag in soup.descendants:
+            name = tag.name
+            if name == 'a':
+                href = tag.get('href')
+                if href is not None:
+                    anchors.append(href)
+            elif name == 'form':
+                has_form = True
+            elif name == 'input':
+                if tag.get('type') == 'file':
+                    has_upload = True
+            elif name == 'script':
+                src = tag.get('src')
+                if src is not None:
+                    script_srcs.append(src)
+                    
+        return anchors, has_form, has_upload, script_srcs
+    
+    def _fetch_status(self, js_info: Dict) -> int:
+        """Request a script file, through the cache, and return the status code."""
+        try:
+            return self._get(js_info['url'])[0]
+        except requests.RequestException as e:
+            if self.verbose:
+                self.formatter.print_warning(f"Error fetching {js_info['url']}: {str(e)}")
+            return 0
+    
+    def _extract_links(self, current_url: str, anchors: List[str]) -> List[str]:
+        """Extract all links from the page's anchor hrefs."""
         links = []
         
-        # Get all <a> tags
-        for a_tag in soup.find_all('a', href=True):
-            href = a_tag['href']
-            
+        for href in anchors:
             # Skip empty links, javascript: links, and anchors
-            if not href or href.startswith(('javascript:', '#', 'mailto:', 'tel:')):
+            if not href or href.startswith(_SKIP_PREFIXES):
                 continue
                 
             # Resolve relative URLs
             absolute_url = urljoin(current_url, href)
             
             # Only follow links within the same domain
-            if urlparse(absolute_url).netloc == urlparse(base_url).netloc:
+            if _netloc(absolute_url) == self._base_netloc:
                 links.append(absolute_url)
                 
         return links
     
-    def _extract_page_info(self, url: str, soup: BeautifulSoup, response) -> Dict:
+    def _extract_page_info(self, url: str, page: PageSummary, status_code: int) -> Dict:
         """Extract forms, parameters, and other details from the page."""
+        _, has_form, has_upload, js_links = page
         parsed_url = urlparse(url)
+        page_netloc = parsed_url.netloc
         
-        # Check for query parameters
+        # Check for query parameters, keeping lowercase keys for the analyzer
         params = parse_qs(parsed_url.query)
-        
-        # Check for forms
-        forms = soup.find_all('form')
-        has_form = len(forms) > 0
-        
-        # Check for file upload fields
-        file_inputs = soup.find_all('input', {'type': 'file'})
-        has_upload = len(file_inputs) > 0
-        
-        # Find JavaScript files
-        js_links = [script['src'] for script in soup.find_all('script', src=True)]
+        param_names_lower = frozenset(k.lower() for k in params)
+        path_lower = parsed_url.path.lower()
         
         # Add discovered JS files to the crawl list
         for js_link in js_links:
             js_url = urljoin(url, js_link)
-            if urlparse(js_url).netloc == urlparse(url).netloc and js_url not in self.visited:
+            if _netloc(js_url) == page_netloc and js_url not in self.visited:
                 self.visited.add(js_url)
-                self.discovered_urls.append({
+                js_info = {
                     'url': js_url,
                     'params': {},
                     'has_form': False,
                     'has_upload': False,
                     'js_file': True,
-                    'status_code': 0  # We haven't fetched it yet
-                })
+                    'status_code': 0  # Filled in after the crawl if fetch_js is set
+                }
+                self.discovered_urls.append(js_info)
+                if self.fetch_js:
+                    self._pending_js.append(js_info)
         
         return {
             'url': url,
             'params': params,
+            'param_names_lower': param_names_lower,
+            'path_lower': path_lower,
             'has_form': has_form,
             'has_upload': has_upload,
             'js_file': False,
-            'status_code': response.status_code
+            'status_code': status_code
         }
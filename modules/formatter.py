@@ -1,11 +1,13 @@
+import io
 import os
 import sys
 import time
-from enum import Enum
+from contextlib import contextmanager
 from typing import List, Dict, Optional
+from urllib.parse import urlsplit
 
 
-class Color(Enum):
+class Color:
     """ANSI color codes for terminal output."""
     RESET = '\033[0m'
     RED = '\033[91m'
@@ -35,7 +37,36 @@ class Formatter:
         """Initialize the formatter with color settings."""
         self.use_color = use_color and self._supports_color()
         self.last_progress_length = 0
+        self._out = None  # None prints to sys.stdout; batch() swaps in a buffer
+        self.refresh_terminal_size()
         
+        # Without color, _colorize is a no-op
+        if not self.use_color:
+            self._colorize = lambda text, color: text
+            
+    def refresh_terminal_size(self) -> None:
+        """Re-read the terminal width, e.g. after the window was resized."""
+        try:
+            self._term_width = os.get_terminal_size().columns
+        except OSError:
+            self._term_width = 120  # fallback width
+        
+    @contextmanager
+    def batch(self):
+        """Collect output in memory and write it to stdout in one call on exit."""
+        if self._out is not None:
+            yield
+            return
+            
+        buf = io.StringIO()
+        self._out = buf
+        try:
+            yield
+        finally:
+            self._out = None
+            sys.stdout.write(buf.getvalue())
+            sys.stdout.flush()
+            
     def _supports_color(self) -> bool:
         """Check if the terminal supports color output."""
         # Check if running in a terminal
@@ -56,47 +87,45 @@ class Formatter:
         term = os.environ.get('TERM', '')
         return term != 'dumb'
         
-    def _colorize(self, text: str, color: Color) -> str:
+    def _colorize(self, text: str, color: str) -> str:
         """Apply color to text if color is enabled."""
-        if not self.use_color:
-            return text
-        return f"{color.value}{text}{Color.RESET.value}"
+        return f"{color}{text}{Color.RESET}"
         
     def print_info(self, message: str) -> None:
         """Print informational message."""
         prefix = self._colorize('[i]', Color.BLUE)
-        print(f"{prefix} {message}")
+        print(f"{prefix} {message}", file=self._out)
         
     def print_status(self, message: str) -> None:
         """Print status message."""
         prefix = self._colorize('[+]', Color.GREEN)
-        print(f"{prefix} {message}")
+        print(f"{prefix} {message}", file=self._out)
         
     def print_warning(self, message: str) -> None:
         """Print warning message."""
         prefix = self._colorize('[!]', Color.YELLOW)
-        print(f"{prefix} {message}")
+        print(f"{prefix} {message}", file=self._out)
         
     def print_error(self, message: str) -> None:
         """Print error message."""
         prefix = self._colorize('[x]', Color.RED)
-        print(f"{prefix} {message}")
+        print(f"{prefix} {message}", file=self._out)
         
     def print_success(self, message: str) -> None:
         """Print success message."""
         prefix = self._colorize('[✓]', Color.CYAN)
-        print(f"{prefix} {message}")
+        print(f"{prefix} {message}", file=self._out)
         
     def print_progress(self, message: str) -> None:
         """Print progress message with overwrite."""
         # Clear previous line if needed
         if self.last_progress_length > 0:
-            print('\r' + ' ' * self.last_progress_length, end='\r')
+            print('\r' + ' ' * self.last_progress_length, end='\r', file=self._out)
             
         # Print new progress
         prefix = self._colorize('[+]', Color.GREEN)
         progress_message = f"{prefix} {message}"
-        print(progress_message, end='\r')
+        print(progress_message, end='\r', file=self._out)
         
         # Store length for next overwrite
         self.last_progress_length = len(progress_message)
@@ -105,7 +134,7 @@ class Formatter:
     def _clear_progress(self) -> None:
         """Clear the progress line."""
         if self.last_progress_length > 0:
-            print('\r' + ' ' * self.last_progress_length, end='\r')
+            print('\r' + ' ' * self.last_progress_length, end='\r', file=self._out)
             self.last_progress_length = 0
             sys.stdout.flush()
         
@@ -123,9 +152,9 @@ class Formatter:
             box_bottom = '└' + '─' * (width - 2) + '┘'
             box_middle = '│ ' + message + ' │'
             
-        print(box_top)
-        print(box_middle)
-        print(box_bottom)
+        print(box_top, file=self._out)
+        print(box_middle, file=self._out)
+        print(box_bottom, file=self._out)
         
     def print_results(self, results: List[Dict], elapsed_time: float, domain: str) -> None:
         """Print the analysis results in a formatted table."""
@@ -138,14 +167,10 @@ class Formatter:
         self.print_header(f"WebDust Results for {domain}")
         self.print_success(f"Analysis complete ({len(results)} endpoints, {vector_count} vectors)")
         self.print_info(f"Time elapsed: {elapsed_time:.2f} seconds")
-        print()
+        print(file=self._out)
+        
+        terminal_width = self._term_width
         
-        # Get terminal width
-        try:
-            terminal_width = os.get_terminal_size().columns
-        except OSError:
-            terminal_width = 120  # fallback width
-            
         # Define column widths based on terminal size
         url_width = terminal_width - 35  # Reserve space for other columns
         col_widths = {
@@ -160,8 +185,25 @@ class Formatter:
         headers = ['URL', 'PARAMS', 'FORM', 'UPLOAD', 'VECTORS']
         header_row = ' '.join(h.ljust(col_widths[k.lower()]) for h, k in zip(headers, ['url', 'params', 'form', 'upload', 'vectors']))
         
-        print(self._colorize(header_row, Color.BOLD))
-        print(self._colorize('─' * terminal_width, Color.BLUE))
+        # Build the whole table in memory and write it out once
+        buf = io.StringIO()
+        write = buf.write
+        write(self._colorize(header_row, Color.BOLD))
+        write('\n')
+        write(self._colorize('─' * terminal_width, Color.BLUE))
+        write('\n')
+        
+        if self.use_color:
+            reset = Color.RESET
+            red = Color.RED
+            yellow = Color.YELLOW
+            green = Color.GREEN
+            magenta = Color.MAGENTA
+            cyan = Color.CYAN
+        else:
+            reset = red = yellow = green = magenta = cyan = ''
+        
+        url_width = col_widths['url']
         
         # Print table rows
         for result in results:
@@ -172,25 +214,25 @@ class Formatter:
             vectors = ', '.join(result.get('vectors', ['INFO']))
             
             # Format URL to fit in column while preserving important parts
-            if len(url) > col_widths['url']:
+            if len(url) > url_width:
                 # Split URL into parts
-                scheme_netloc = url.split('//')[-1].split('/')[0]
-                path_parts = url[len(scheme_netloc) + 8:].split('?')
-                path = path_parts[0]
-                query = f"?{path_parts[1]}" if len(path_parts) > 1 else ""
+                parts = urlsplit(url)
+                netloc = parts.netloc
+                path = parts.path
+                query = f"?{parts.query}" if parts.query else ""
                 
                 # Calculate available space
-                available_space = col_widths['url'] - len(scheme_netloc) - 5  # 5 for "://" and "..."
+                available_space = url_width - len(netloc) - 5  # 5 for "://" and "..."
                 
                 if len(path) > available_space:
                     # Truncate the middle of the path
                     half_space = (available_space - 3) // 2
                     path = path[:half_space] + "..." + path[-half_space:]
                 
-                url = f"{scheme_netloc}/{path}{query}"
+                url = f"{netloc}{path}{query}"
                 
             # Format row
-            url_col = url.ljust(col_widths['url'])
+            url_col = url.ljust(url_width)
             params_col = str(params_count).ljust(col_widths['params'])
             form_col = has_form.ljust(col_widths['form'])
             upload_col = has_upload.ljust(col_widths['upload'])
@@ -198,54 +240,59 @@ class Formatter:
             
             # Apply color to vectors based on severity
             if any(v in ['IDOR', 'LFI', 'SQLI', 'RCE'] for v in result.get('vectors', [])):
-                vectors_col = self._colorize(vectors_col, Color.RED)
+                vectors_col = f"{red}{vectors_col}{reset}"
             elif any(v in ['XSS', 'CSRF', 'UPLOAD', 'REDIR'] for v in result.get('vectors', [])):
-                vectors_col = self._colorize(vectors_col, Color.YELLOW)
+                vectors_col = f"{yellow}{vectors_col}{reset}"
             elif any(v in ['FORM', 'AUTH', 'ADMIN'] for v in result.get('vectors', [])):
-                vectors_col = self._colorize(vectors_col, Color.MAGENTA)
+                vectors_col = f"{magenta}{vectors_col}{reset}"
             
             # Apply color to URL based on status code
             status_code = result.get('status_code', 0)
             if status_code >= 400:
-                url_col = self._colorize(url_col, Color.RED)
+                url_col = f"{red}{url_col}{reset}"
             elif status_code >= 300:
-                url_col = self._colorize(url_col, Color.YELLOW)
+                url_col = f"{yellow}{url_col}{reset}"
             elif status_code >= 200:
-                url_col = self._colorize(url_col, Color.GREEN)
+                url_col = f"{green}{url_col}{reset}"
                 
             # Highlight forms and uploads
             if has_form == 'Yes':
-                form_col = self._colorize(form_col, Color.MAGENTA)
+                form_col = f"{magenta}{form_col}{reset}"
             if has_upload == 'Yes':
-                upload_col = self._colorize(upload_col, Color.RED)
+                upload_col = f"{red}{upload_col}{reset}"
                 
             # Format parameters count
             if params_count > 0:
-                params_col = self._colorize(params_col, Color.CYAN)
+                params_col = f"{cyan}{params_col}{reset}"
                 
-            row = f"{url_col} {params_col} {form_col} {upload_col} {vectors_col}"
-            print(row)
+            write(f"{url_col} {params_col} {form_col} {upload_col} {vectors_col}\n")
             
-        print()
+        write('\n')
+        (self._out or sys.stdout).write(buf.getvalue())
         
     def save_results(self, results: List[Dict], filename: str, domain: str, elapsed_time: float) -> None:
         """Save results to a file."""
-        with open(filename, 'w') as f:
+        row_format = "{:<50} {:<10} {:<6} {:<8} {:<20}\n"
+        
+        def format_rows():
+            for result in results:
+                url = result['url']
+                params_count = len(result['params'])
+                has_form = 'Yes' if result.get('has_form') else 'No'
+                has_upload = 'Yes' if result.get('has_upload') else 'No'
+                vectors = ', '.join(result.get('vectors', ['INFO']))
+                
+                yield row_format.format(url[:50], params_count, has_form, has_upload, vectors)
+        
+        with open(filename, 'w', buffering=1 << 16) as f:
             f.write(f"WebDust Results for {domain}\n")
             f.write(f"Time: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
             f.write(f"Duration: {elapsed_time:.2f} seconds\n")
             f.write(f"Endpoints: {len(results)}\n\n")
             
             # Write table header
-            f.write(f"{'URL':<50} {'PARAMS':<10} {'FORM':<6} {'UPLOAD':<8} {'VECTORS':<20}\n")
+            f.write(row_format.format('URL', 'PARAMS', 'FORM', 'UPLOAD', 'VECTORS'))
             f.write('-' * 100 + '\n')
             
-            # Write table rows
-            for result in results:
-                url = result['url']
-                params_count = len(result['params'])
-                has_form = 'Yes' if result.get('has_form') else 'No'
-                has_upload = 'Yes' if result.get('has_upload') else 'No'
-                vectors = ', '.join(result.get('vectors', ['INFO']))
-                
-                f.write(f"{url[:50]:<50} {params_count:<10} {has_form:<6} {has_upload:<8} {vectors:<20}\n")
\ No newline at end of file
+            # Write table rows as they are formatted, without building them all up front
+            f.writelines(format_rows())
\ No newline at end of file
@@ -1,12 +1,16 @@
 import re
 import os
+from functools import lru_cache
 from urllib.parse import urlparse
 from .formatter import Color
 
+_URL_SCHEME_RE = re.compile(r'^https?://')
+
+@lru_cache(maxsize=4096)
 def validate_url(url: str) -> bool:
     """Validate if the input is a valid URL."""
     # Add http:// if missing to make urlparse work
-    if not url.startswith(('http://', 'https://')):
+    if not _URL_SCHEME_RE.match(url):
         url = 'http://' + url
         
     # Check basic URL structure
@@ -29,9 +33,10 @@ def print_banner(formatter):
     """
     
     formatter._clear_progress()
-    print(formatter._colorize(banner, Color.CYAN))
-    print(formatter._colorize(" Web Application Reconnaissance Tool", Color.BOLD))
-    print(formatter._colorize(" https://github.com/Cr3zy-dev/webdust", Color.BLUE))
-    print()
-    print(formatter._colorize("=" * 60, Color.CYAN))
-    print()
+    out = formatter._out
+    print(formatter._colorize(banner, Color.CYAN), file=out)
+    print(formatter._colorize(" Web Application Reconnaissance Tool", Color.BOLD), file=out)
+    print(formatter._colorize(" https://github.com/Cr3zy-dev/webdust", Color.BLUE), file=out)
+    print(file=out)
+    print(formatter._colorize("=" * 60, Color.CYAN), file=out)
+    print(file=out)
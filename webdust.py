@@ -1,20 +1,61 @@
 #!/usr/bin/env python3
 
-import argparse
 import sys
 import time
 import json
 import os
-from urllib.parse import urlparse
+import re
 
-from modules.crawler import Crawler
-from modules.analyzer import Analyzer
 from modules.formatter import Formatter, Color
 from modules.utils import validate_url, print_banner
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional scheme and the host part of a target URL
+_URL_RE = re.compile(r'^(?:(?P<scheme>https?)://)?(?P<netloc>[^/?#]*)')
+
+# Arguments that may accompany -s/--show on the fast path that skips argparse
+_SHOW_FAST_ARGS = frozenset({'-s', '--show', '--no-color'})
+
+# Wordlist categories and their display names, in prompt order
+_WORDLIST_CATEGORIES = (
+    ('sqli', 'SQL Injection'),
+    ('xss', 'Cross-Site Scripting (XSS)'),
+    ('lfi', 'Local File Inclusion (LFI)'),
+    ('idor', 'Insecure Direct Object References (IDOR)'),
+    ('redir', 'Open Redirect'),
+)
+
+# Wordlist configuration location
+_CONFIG_DIR = os.path.join(".", "webdust")
+_CONFIG_PATH = os.path.join(_CONFIG_DIR, "webdust_wordlists.json")
+
+# Parsed wordlist config, reused until the file's mtime changes
+_CONFIG_CACHE = {"mtime": None, "data": {}}
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize obj as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _load_json(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 def parse_arguments():
     """Parse command line arguments."""
+    # argparse is only needed here, so it is not loaded for the --show fast path
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="WebDust - Web Application Reconnaissance Tool",
         formatter_class=argparse.RawTextHelpFormatter
@@ -24,47 +65,46 @@ def parse_arguments():
                         help="Target URL to scan (e.g., https://example.com)")
     parser.add_argument("-d", "--depth", type=int, default=2,
                         help="Crawl depth (default: 2)")
+    parser.add_argument("-c", "--concurrency", type=int, default=10,
+                        help="Maximum number of concurrent requests (default: 10)")
+    parser.add_argument("--delay", type=float, default=0.1,
+                        help="Minimum seconds between request starts, capping throughput at 1/delay\n"
+                             "requests per second across all workers (default: 0.1)")
     parser.add_argument("--no-color", action="store_true",
                         help="Disable colored output (default: False)")
     parser.add_argument("-v", "--verbose", action="store_true",
                         help="Enable verbose output (default: False)")
     parser.add_argument("-o", "--output", 
                         help="Save results to file (default: None)")
+    parser.add_argument("--cache-dir",
+                        help="Cache HTTP responses in this directory and reuse them on later scans (default: None)")
+    parser.add_argument("--fetch-js", action="store_true",
+                        help="Request discovered JavaScript files to record their status codes (default: False)")
     parser.add_argument("-w", "--wordlist", action="store_true",
                         help="Configure custom wordlists for vulnerability detection (default: False)")
     parser.add_argument("-s", "--show", action="store_true",
                         help="Show currently configured custom wordlists")
+    parser.add_argument("--wl", action="append", metavar="CAT=PATH",
+                        help="Configure a custom wordlist without prompting (repeatable)\n"
+                             "CAT is one of: sqli, xss, lfi, idor, redir")
     
     return parser.parse_args()
 
 
 def get_wordlist_config_path():
     """Get the path to the wordlist configuration file."""
-    # Create webdust directory if it doesn't exist
-    config_dir = os.path.join(".", "webdust")
-    os.makedirs(config_dir, exist_ok=True)
-    return os.path.join(config_dir, "webdust_wordlists.json")
+    return _CONFIG_PATH
 
 
 def configure_wordlists(formatter):
     """Interactive configuration of custom wordlists."""
-    config_path = get_wordlist_config_path()
-    
     formatter.print_status("Configuring custom wordlists...")
     formatter.print_info("Enter file paths for each vulnerability category (press Enter to skip):")
     print()
     
-    categories = {
-        'sqli': 'SQL Injection',
-        'xss': 'Cross-Site Scripting (XSS)',
-        'lfi': 'Local File Inclusion (LFI)',
-        'idor': 'Insecure Direct Object References (IDOR)',
-        'redir': 'Open Redirect'
-    }
-    
     config = {}
     
-    for category, description in categories.items():
+    for category, description in _WORDLIST_CATEGORIES:
         while True:
             path = input(f"{description} wordlist path: ").strip()
             
@@ -82,10 +122,46 @@ def configure_wordlists(formatter):
                 if retry != 'y':
                     break
     
-    # Save configuration
+    save_wordlist_config(formatter, config)
+
+
+def configure_wordlists_from_args(formatter, entries):
+    """Non-interactive configuration of custom wordlists from CAT=PATH entries."""
+    descriptions = dict(_WORDLIST_CATEGORIES)
+    
+    # Update the saved config so categories not given keep their paths
+    config = dict(load_wordlist_config())
+    
+    for entry in entries:
+        category, sep, path = entry.partition('=')
+        category = category.strip().lower()
+        path = path.strip()
+        
+        if not sep or not path:
+            formatter.print_error(f"Invalid wordlist entry (expected CAT=PATH): {entry}")
+            sys.exit(1)
+        if category not in descriptions:
+            formatter.print_error(f"Unknown wordlist category '{category}'. Use one of: {', '.join(descriptions)}")
+            sys.exit(1)
+        if not os.path.isfile(path):
+            formatter.print_error(f"File not found: {path}")
+            sys.exit(1)
+            
+        config[category] = path
+        formatter.print_success(f"Added {descriptions[category]} wordlist: {path}")
+        
+    save_wordlist_config(formatter, config)
+
+
+def save_wordlist_config(formatter, config):
+    """Write the wordlist configuration to disk."""
+    config_path = get_wordlist_config_path()
+    
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=2)
+        # Only writing the config needs the directory; reads treat it as optional
+        os.makedirs(_CONFIG_DIR, exist_ok=True)
+        with open(config_path, 'wb') as f:
+            f.write(_dump_json(config))
         formatter.print_success(f"Configuration saved to {config_path}")
         
         if config:
@@ -97,36 +173,50 @@ def configure_wordlists(formatter):
         formatter.print_error(f"Failed to save configuration: {str(e)}")
 
 
+def _existing_files(paths):
+    """Return the subset of paths that are existing files, listing each parent directory once."""
+    by_dir = {}
+    for path in paths:
+        by_dir.setdefault(os.path.dirname(path) or '.', []).append(path)
+        
+    existing = set()
+    for directory, dir_paths in by_dir.items():
+        try:
+            with os.scandir(directory) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            names = set()
+            
+        for path in dir_paths:
+            # Fall back to a direct check for misses, e.g. on case-insensitive filesystems
+            if os.path.basename(path) in names or os.path.isfile(path):
+                existing.add(path)
+                
+    return existing
+
+
 def show_wordlist_config(formatter):
     """Display current wordlist configuration."""
     config_path = get_wordlist_config_path()
     
-    if not os.path.isfile(config_path):
-        formatter.print_info("No custom wordlists configured.")
-        return
-    
     try:
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        try:
+            with open(config_path, 'rb') as f:
+                config = _load_json(f.read())
+        except FileNotFoundError:
+            config = {}
             
         if not config:
             formatter.print_info("No custom wordlists configured.")
             return
             
         formatter.print_header("Custom Wordlist Configuration")
+        existing = _existing_files(config.values())
         
-        categories = {
-            'sqli': 'SQL Injection',
-            'xss': 'Cross-Site Scripting (XSS)',
-            'lfi': 'Local File Inclusion (LFI)',
-            'idor': 'Insecure Direct Object References (IDOR)',
-            'redir': 'Open Redirect'
-        }
-        
-        for category, description in categories.items():
+        for category, description in _WORDLIST_CATEGORIES:
             if category in config:
                 path = config[category]
-                status = "✓" if os.path.isfile(path) else "✗ (file not found)"
+                status = "✓" if path in existing else "✗ (file not found)"
                 formatter.print_info(f"{description}: {path} {status}")
             else:
                 formatter.print_info(f"{description}: Not configured")
@@ -143,29 +233,62 @@ def load_wordlist_config():
         return {}
         
     try:
-        with open(config_path, 'r') as f:
-            return json.load(f)
+        mtime = os.path.getmtime(config_path)
+        if mtime == _CONFIG_CACHE["mtime"]:
+            return _CONFIG_CACHE["data"]
+            
+        with open(config_path, 'rb') as f:
+            data = _load_json(f.read())
     except Exception:
         return {}
+        
+    _CONFIG_CACHE["mtime"] = mtime
+    _CONFIG_CACHE["data"] = data
+    return data
 
 
 def main():
     """Main function to run WebDust."""
+    # Showing the wordlist config needs no further arguments, so skip argparse
+    argv = sys.argv[1:]
+    if _SHOW_FAST_ARGS.issuperset(argv) and ('-s' in argv or '--show' in argv):
+        formatter = Formatter(use_color='--no-color' not in argv)
+        with formatter.batch():
+            print_banner(formatter)
+            show_wordlist_config(formatter)
+        return
+    
     args = parse_arguments()
     
     # Initialize formatter with color setting
     formatter = Formatter(use_color=not args.no_color)
     
+    # --wl replaces both the prompts and the scan, so it must be used on its own
+    if args.wl and (args.wordlist or args.url):
+        formatter.print_error("--wl cannot be combined with -w or -u/--url. Save the wordlists first, then run the scan")
+        sys.exit(1)
+    
     # Handle wordlist configuration mode
     if args.wordlist:
+        # The prompts need a terminal; scripts and CI use --wl instead
+        if not sys.stdin.isatty():
+            formatter.print_error("-w needs an interactive terminal. Use --wl CAT=PATH to configure wordlists without prompts")
+            sys.exit(1)
         print_banner(formatter)
         configure_wordlists(formatter)
         return
     
+    # Handle non-interactive wordlist configuration
+    if args.wl:
+        print_banner(formatter)
+        configure_wordlists_from_args(formatter, args.wl)
+        return
+    
     # Handle show wordlists mode
     if args.show:
-        print_banner(formatter)
-        show_wordlist_config(formatter)
+        with formatter.batch():
+            print_banner(formatter)
+            show_wordlist_config(formatter)
         return
     
     # Require URL for scanning
@@ -173,35 +296,58 @@ def main():
         formatter.print_error("URL is required for scanning. Use -u/--url or see --help")
         sys.exit(1)
     
-    # Print banner
-    print_banner(formatter)
+    # Scan-only modules are imported here so the wordlist modes start faster
+    from modules.crawler import Crawler
+    from modules.analyzer import Analyzer
+    from modules.cache import DiskCache
     
-    # Validate URL
-    if not validate_url(args.url):
-        formatter.print_error(f"Invalid URL: {args.url}")
-        sys.exit(1)
-    
-    # Add http:// if missing
-    if not args.url.startswith(('http://', 'https://')):
-        args.url = 'https://' + args.url
-        formatter.print_info(f"URL updated to: {args.url}")
-    
-    # Parse domain for display
-    domain = urlparse(args.url).netloc
-    formatter.print_status(f"Target: {domain}")
-    formatter.print_status(f"Crawl depth: {args.depth}")
-    
-    # Load custom wordlist configuration
-    wordlist_config = load_wordlist_config()
-    if wordlist_config:
-        formatter.print_info(f"Loaded {len(wordlist_config)} custom wordlist(s)")
+    # Emit the startup output in one write
+    with formatter.batch():
+        # Print banner
+        print_banner(formatter)
+        
+        # Split scheme and domain in one pass; add https:// if missing
+        url_match = _URL_RE.match(args.url)
+        if url_match.group('scheme') is None:
+            target_url = 'https://' + args.url
+        else:
+            target_url = args.url
+        
+        # Validate the normalized URL once
+        if not validate_url(target_url):
+            formatter.print_error(f"Invalid URL: {args.url}")
+            sys.exit(1)
+        
+        if target_url != args.url:
+            args.url = target_url
+            formatter.print_info(f"URL updated to: {args.url}")
+        
+        domain = url_match.group('netloc')
+        formatter.print_status(f"Target: {domain}")
+        formatter.print_status(f"Crawl depth: {args.depth}")
+        
+        if args.concurrency < 1:
+            formatter.print_error("Concurrency must be at least 1")
+            sys.exit(1)
+        
+        if args.delay < 0:
+            formatter.print_error("Delay cannot be negative")
+            sys.exit(1)
+        
+        # Load custom wordlist configuration
+        wordlist_config = load_wordlist_config()
+        if wordlist_config:
+            formatter.print_info(f"Loaded {len(wordlist_config)} custom wordlist(s)")
     
     # Start timer
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         # Initialize crawler and analyzer with wordlist config
-        crawler = Crawler(formatter=formatter, verbose=args.verbose)
+        cache = DiskCache(args.cache_dir) if args.cache_dir else None
+        crawler = Crawler(formatter=formatter, verbose=args.verbose,
+                          max_workers=args.concurrency, delay=args.delay,
+                          fetch_js=args.fetch_js, cache=cache)
         analyzer = Analyzer(formatter=formatter, wordlist_config=wordlist_config)
         
         # Start crawling
@@ -212,13 +358,14 @@ def main():
             formatter.print_warning("No URLs discovered during crawl!")
             sys.exit(0)
             
-        # Analyze discovered URLs
-        formatter.print_status("Analyzing discovered endpoints...")
-        results = analyzer.analyze_urls(discovered_urls)
-        
-        # Display results
-        elapsed_time = time.time() - start_time
-        formatter.print_results(results, elapsed_time, domain)
+        with formatter.batch():
+            # Analyze discovered URLs
+            formatter.print_status("Analyzing discovered endpoints...")
+            results = analyzer.analyze_urls(discovered_urls)
+            
+            # Display results
+            elapsed_time = (time.perf_counter_ns() - start_ns) / 1e9
+            formatter.print_results(results, elapsed_time, domain)
         
         # Save to file if specified
         if args.output: